@@ -15,15 +15,303 @@ ERROR MESSAGE:
   [magic:4][0xFFFFFFFE:4][msgLen:4][0:4][message:utf8]
 """
 
+import asyncio
+import select
 import struct
+import time
 import numpy as np
 from typing import BinaryIO, Union
 import socket
+import weakref
 
 MAGIC = b'SPKR'
+# Magic compared as a single uint32 instead of a bytes object
+_MAGIC_INT = int.from_bytes(MAGIC, 'little')
+# Header format parsed once at import instead of per call
+_HEADER = struct.Struct('<IIII')
 END_MARKER = 0xFFFFFFFF
 ERROR_MARKER = 0xFFFFFFFE
 
+# Lets the kernel wait for a full message in a single recv syscall
+_MSG_WAITALL = getattr(socket, 'MSG_WAITALL', 0)
+
+# Linux zero-copy send support (not in the socket module's constants)
+_SO_ZEROCOPY = getattr(socket, 'SO_ZEROCOPY', 60)
+_MSG_ZEROCOPY = getattr(socket, 'MSG_ZEROCOPY', 0x4000000)
+_MSG_ERRQUEUE = getattr(socket, 'MSG_ERRQUEUE', 0x2000)
+
+# Payloads below this are cheaper to copy than to pin for zero-copy
+ZEROCOPY_MIN_BYTES = 16 * 1024
+
+# Sockets that were successfully opted into zero-copy sends
+_ZEROCOPY_SOCKS: 'weakref.WeakSet' = weakref.WeakSet()
+
+
+def configure_stream_socket(
+    sock: socket.socket,
+    *,
+    nodelay: bool = True,
+    sndbuf: int = 1 << 20,
+    rcvbuf: int = 1 << 20
+) -> None:
+    """
+    Tune a socket for low-latency audio streaming.
+
+    Disables Nagle's algorithm (TCP only; AF_UNIX has no Nagle) so
+    small end/error messages are not delayed, and sizes the kernel
+    send/receive buffers so a whole audio chunk fits in one copy.
+    Call on the connected/accepted socket before streaming chunks.
+    """
+    if nodelay:
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError:
+            pass  # Not a TCP socket
+    if sndbuf:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, sndbuf)
+    if rcvbuf:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, rcvbuf)
+
+
+def enable_zerocopy(sock: socket.socket) -> bool:
+    """
+    Opt a TCP socket into kernel zero-copy sends (Linux MSG_ZEROCOPY).
+
+    Large audio payloads are then DMA'd from the numpy buffer without
+    the userspace-to-kernel copy. Returns False (and leaves the socket
+    untouched) where the kernel or socket family does not support it.
+
+    Sends on an opted-in socket block until the kernel's completion
+    notification has been reaped, so callers may reuse or overwrite a
+    payload buffer as soon as the write call returns - same contract
+    as a plain copying send.
+    """
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, _SO_ZEROCOPY, 1)
+    except OSError:
+        return False
+    _ZEROCOPY_SOCKS.add(sock)
+    return True
+
+
+# struct sock_extended_err ee_origin value for zero-copy completions
+_SO_EE_ORIGIN_ZEROCOPY = 5
+
+
+def _await_zerocopy_completions(sock: socket.socket, count: int) -> None:
+    """
+    Block until the kernel posts completions for `count` zero-copy sends.
+
+    MSG_ZEROCOPY pins the payload pages; the buffer must stay
+    untouched until its completion notification arrives on the error
+    queue. Each notification carries an inclusive range of completed
+    send IDs in ee_info..ee_data, so one read may cover several sends.
+    MSG_ERRQUEUE reads never block, so an empty queue is waited out
+    with poll() - POLLERR is reported even with no events requested.
+    """
+    poller = select.poll()
+    poller.register(sock, 0)
+    # Completions normally arrive within the send's RTT; the deadline
+    # only guards against a kernel that never posts one
+    deadline = time.monotonic() + 5.0
+    remaining = count
+    while remaining > 0:
+        try:
+            _, ancdata, _, _ = sock.recvmsg(0, 512, _MSG_ERRQUEUE)
+        except BlockingIOError:
+            if time.monotonic() > deadline:
+                return
+            poller.poll(50)
+            continue
+        except OSError:
+            return
+        for _, _, cmsg_data in ancdata:
+            # struct sock_extended_err: u32 ee_errno, u8 ee_origin,
+            # u8 ee_type, u8 ee_code, u8 ee_pad, u32 ee_info, u32 ee_data
+            if len(cmsg_data) >= 16 and cmsg_data[4] == _SO_EE_ORIGIN_ZEROCOPY:
+                lo, hi = struct.unpack_from('<II', cmsg_data, 8)
+                remaining -= hi - lo + 1
+
+
+def _send_zerocopy(sock: socket.socket, view: memoryview) -> None:
+    sent = 0
+    sends = 0
+    while sent < len(view):
+        sent += sock.send(view[sent:], _MSG_ZEROCOPY)
+        sends += 1
+    _await_zerocopy_completions(sock, sends)
+
+
+def _aligned_empty(count: int, dtype=np.float32, align: int = 64) -> np.ndarray:
+    """
+    Allocate an uninitialized array whose data is align-byte aligned.
+
+    np.empty gives arbitrary alignment; over-allocating and slicing to
+    a 64-byte boundary means downstream SIMD consumers (resamplers,
+    mixers) can use aligned loads on received audio.
+    """
+    itemsize = np.dtype(dtype).itemsize
+    pad = align // itemsize
+    buf = np.empty(count + pad, dtype=dtype)
+    offset = (-buf.ctypes.data) % align // itemsize
+    return buf[offset:offset + count]
+
+
+# Reciprocal scales for PCM normalization (multiply beats divide)
+_I16_SCALE = np.float32(1.0 / 32768.0)
+_I32_SCALE = np.float32(1.0 / 2147483648.0)
+
+# Freelist of 16-byte header buffers so a sustained stream does not
+# allocate one per message
+_HEADER_POOL: list = []
+_HEADER_POOL_MAX = 8
+
+
+def _acquire_header_buf() -> bytearray:
+    try:
+        return _HEADER_POOL.pop()
+    except IndexError:
+        return bytearray(16)
+
+
+def _release_header_buf(buf: bytearray) -> None:
+    if len(_HEADER_POOL) < _HEADER_POOL_MAX:
+        _HEADER_POOL.append(buf)
+
+
+def _send_vectored(sock: socket.socket, header: bytes, payload) -> None:
+    """
+    Send header + payload in one syscall via sendmsg when available,
+    falling back to two sendall calls. Avoids concatenating the header
+    with a copy of the payload in userspace.
+    """
+    if hasattr(sock, 'sendmsg'):
+        view = memoryview(payload).cast('B')
+        if len(view) >= ZEROCOPY_MIN_BYTES and sock in _ZEROCOPY_SOCKS:
+            sock.sendall(header)
+            _send_zerocopy(sock, view)
+            return
+        sent = sock.sendmsg([header, view])
+        total = len(header) + len(view)
+        # sendmsg may send partially; finish with sendall on the remainder
+        if sent < total:
+            if sent < len(header):
+                sock.sendall(header[sent:])
+                sock.sendall(view)
+            else:
+                sock.sendall(view[sent - len(header):])
+    else:
+        sock.sendall(header)
+        sock.sendall(payload)
+
+
+class _SocketAdapter:
+    """Pre-resolved send/recv strategy for socket streams."""
+
+    __slots__ = ('stream',)
+
+    def __init__(self, sock: socket.socket):
+        self.stream = sock
+
+    def send_message(self, header: bytes, payload=None) -> None:
+        if payload is None:
+            self.stream.sendall(header)
+        else:
+            _send_vectored(self.stream, header, payload)
+
+    def read_exact_into(self, buf) -> None:
+        _recv_exact_into(self.stream, buf)
+
+
+class _FileAdapter:
+    """Pre-resolved write/read strategy for file-like streams."""
+
+    __slots__ = ('stream',)
+
+    def __init__(self, f: BinaryIO):
+        self.stream = f
+
+    def send_message(self, header: bytes, payload=None) -> None:
+        self.stream.write(header)
+        if payload is not None:
+            # write() takes buffer-protocol objects; no tobytes() copy
+            if isinstance(payload, np.ndarray):
+                payload = memoryview(payload).cast('B')
+            self.stream.write(payload)
+        self.stream.flush()
+
+    def read_exact_into(self, buf) -> None:
+        view = memoryview(buf)
+        if view.format != 'B':
+            view = view.cast('B')
+        filled = 0
+        readinto = getattr(self.stream, 'readinto', None)
+        while filled < len(view):
+            if readinto is not None:
+                n = readinto(view[filled:])
+            else:
+                data = self.stream.read(len(view) - filled)
+                n = len(data)
+                view[filled:filled + n] = data
+            if not n:
+                raise IOError("Incomplete message")
+            filled += n
+
+
+# Memoizes the is-socket decision per stream. Weak keys so dead
+# streams drop out; caching only the bool (not the adapter) avoids a
+# value->key reference that would defeat the weak keying.
+_IS_SOCKET_CACHE: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+
+
+def _adapt(stream):
+    """
+    Resolve the stream's I/O strategy once.
+
+    The dispatch decision is cached by stream identity, so repeated
+    calls with the same raw stream skip the hasattr probe. Callers on
+    a hot path can also pass the returned adapter back in directly.
+    """
+    if isinstance(stream, (_SocketAdapter, _FileAdapter)):
+        return stream
+    try:
+        is_socket = _IS_SOCKET_CACHE.get(stream)
+    except TypeError:
+        is_socket = None  # Stream type is not weak-referenceable
+    else:
+        if is_socket is None:
+            is_socket = hasattr(stream, 'sendall') or hasattr(stream, 'recv_into')
+            _IS_SOCKET_CACHE[stream] = is_socket
+    if is_socket is None:
+        is_socket = hasattr(stream, 'sendall') or hasattr(stream, 'recv_into')
+    return _SocketAdapter(stream) if is_socket else _FileAdapter(stream)
+
+
+def _recv_exact_into(sock: socket.socket, buf) -> None:
+    """
+    Fill buf completely from the socket using recv_into.
+
+    Avoids the per-recv bytes allocation and concatenation of a
+    recv-and-append loop.
+    """
+    view = memoryview(buf)
+    received = 0
+    # MSG_WAITALL lets the kernel assemble the full message in one
+    # syscall; fall back to a plain loop on short returns (signals)
+    # or when the flag is unavailable
+    if _MSG_WAITALL:
+        try:
+            received = sock.recv_into(view, len(buf), _MSG_WAITALL)
+            if received == 0 and len(buf):
+                raise IOError("Connection closed mid-message")
+        except InterruptedError:
+            received = 0
+    while received < len(buf):
+        n = sock.recv_into(view[received:])
+        if not n:
+            raise IOError("Connection closed mid-message")
+        received += n
+
 
 def write_chunk(
     stream: Union[BinaryIO, socket.socket],
@@ -40,22 +328,20 @@ def write_chunk(
         samples: Audio samples as numpy array
         sample_rate: Sample rate in Hz
     """
-    # Ensure float32
-    samples_f32 = samples.astype(np.float32)
+    # Ensure float32 (zero-copy when already float32 and C-contiguous).
+    # Integer PCM is cast and normalized to [-1, 1] in one fused
+    # multiply pass instead of astype + divide.
+    if samples.dtype == np.int16:
+        samples_f32 = np.multiply(samples, _I16_SCALE, dtype=np.float32)
+    elif samples.dtype == np.int32:
+        samples_f32 = np.multiply(samples, _I32_SCALE, dtype=np.float32)
+    else:
+        samples_f32 = np.ascontiguousarray(samples, dtype=np.float32)
     
     # Build header: magic(4) + id(4) + count(4) + rate(4) = 16 bytes
-    header = struct.pack('<4sIII', MAGIC, chunk_id, len(samples_f32), sample_rate)
-    
-    # Get sample bytes
-    sample_bytes = samples_f32.tobytes()
-    
-    # Write atomically if possible
-    if hasattr(stream, 'sendall'):
-        stream.sendall(header + sample_bytes)
-    else:
-        stream.write(header)
-        stream.write(sample_bytes)
-        stream.flush()
+    header = _HEADER.pack(_MAGIC_INT, chunk_id, len(samples_f32), sample_rate)
+
+    _adapt(stream).send_message(header, samples_f32)
 
 
 def write_end(
@@ -69,13 +355,9 @@ def write_end(
         stream: Socket or file-like object
         total_chunks: Total number of chunks sent
     """
-    header = struct.pack('<4sIII', MAGIC, END_MARKER, total_chunks, 0)
-    
-    if hasattr(stream, 'sendall'):
-        stream.sendall(header)
-    else:
-        stream.write(header)
-        stream.flush()
+    header = _HEADER.pack(_MAGIC_INT, END_MARKER, total_chunks, 0)
+
+    _adapt(stream).send_message(header)
 
 
 def write_error(
@@ -90,41 +372,330 @@ def write_error(
         message: Error description
     """
     msg_bytes = message.encode('utf-8')
-    header = struct.pack('<4sIII', MAGIC, ERROR_MARKER, len(msg_bytes), 0)
-    
-    if hasattr(stream, 'sendall'):
-        stream.sendall(header + msg_bytes)
-    else:
-        stream.write(header)
-        stream.write(msg_bytes)
-        stream.flush()
+    header = _HEADER.pack(_MAGIC_INT, ERROR_MARKER, len(msg_bytes), 0)
+
+    _adapt(stream).send_message(header, msg_bytes)
+
+
+def _sendmsg_all(sock: socket.socket, bufs: list) -> None:
+    """Send every buffer in one sendmsg, retrying past partial sends."""
+    while bufs:
+        sent = sock.sendmsg(bufs)
+        i = 0
+        while sent and i < len(bufs):
+            if sent >= len(bufs[i]):
+                sent -= len(bufs[i])
+                i += 1
+            else:
+                bufs[i] = bufs[i][sent:]
+                sent = 0
+        bufs = bufs[i:]
+
+
+class BatchedChunkWriter:
+    """
+    Coalesce several write_chunk calls into a single sendmsg.
+
+    Each chunk contributes its header and payload view to a pending
+    iovec list; the list is flushed in one syscall once max_batch
+    chunks accumulate or max_delay_ms has passed since the first
+    pending chunk. write_end flushes whatever is pending.
+    """
+
+    def __init__(
+        self,
+        stream: Union[BinaryIO, socket.socket],
+        max_batch: int = 8,
+        max_delay_ms: float = 5.0
+    ):
+        self.stream = stream
+        self.max_batch = max_batch
+        self.max_delay = max_delay_ms / 1000.0
+        self._bufs: list = []
+        self._pending = 0
+        self._first_at = 0.0
+
+    def write_chunk(
+        self,
+        chunk_id: int,
+        samples: np.ndarray,
+        sample_rate: int = 24000
+    ) -> None:
+        samples_f32 = np.ascontiguousarray(samples, dtype=np.float32)
+        header = _HEADER.pack(_MAGIC_INT, chunk_id, len(samples_f32), sample_rate)
+        if not self._bufs:
+            self._first_at = time.monotonic()
+        self._bufs.append(header)
+        self._bufs.append(memoryview(samples_f32).cast('B'))
+        self._pending += 1
+        if (self._pending >= self.max_batch
+                or time.monotonic() - self._first_at >= self.max_delay):
+            self.flush()
+
+    def write_end(self, total_chunks: int) -> None:
+        self._bufs.append(_HEADER.pack(_MAGIC_INT, END_MARKER, total_chunks, 0))
+        self.flush()
+
+    def flush(self) -> None:
+        if not self._bufs:
+            return
+        bufs, self._bufs = self._bufs, []
+        self._pending = 0
+        if hasattr(self.stream, 'sendmsg'):
+            _sendmsg_all(self.stream, bufs)
+        elif hasattr(self.stream, 'sendall'):
+            for buf in bufs:
+                self.stream.sendall(buf)
+        else:
+            for buf in bufs:
+                self.stream.write(buf)
+            self.stream.flush()
+
 
+class ChunkReader:
+    """
+    Per-connection reader with a persistent readahead buffer.
 
-def read_chunk(stream: Union[BinaryIO, socket.socket]) -> dict:
+    read_chunk issues separate recvs for header and payload; this
+    reader instead drains whatever the kernel has buffered in one
+    recv_into, so the next message's header usually arrives with the
+    previous payload's tail and needs no extra syscall. Large payloads
+    are still received directly into the numpy array past whatever is
+    already buffered.
+    """
+
+    def __init__(self, sock: socket.socket, readahead: int = 1 << 16):
+        self.sock = sock
+        self._buf = bytearray(readahead)
+        self._view = memoryview(self._buf)
+        self._start = 0
+        self._end = 0
+
+    def _buffered(self) -> int:
+        return self._end - self._start
+
+    def _fill(self) -> None:
+        if self._start:
+            # Compact the unread tail to the front
+            buffered = self._buffered()
+            self._view[:buffered] = self._view[self._start:self._end]
+            self._start = 0
+            self._end = buffered
+        n = self.sock.recv_into(self._view[self._end:])
+        if not n:
+            raise IOError("Connection closed mid-message")
+        self._end += n
+
+    def _take(self, n: int) -> memoryview:
+        if n > len(self._buf):
+            grown = bytearray(n)
+            grown[:self._buffered()] = self._view[self._start:self._end]
+            self._end = self._buffered()
+            self._start = 0
+            self._buf = grown
+            self._view = memoryview(grown)
+        while self._buffered() < n:
+            self._fill()
+        taken = self._view[self._start:self._start + n]
+        self._start += n
+        return taken
+
+    def read_message(self) -> dict:
+        """Read one message; same result dicts as read_chunk."""
+        magic_int, id_or_marker, count, rate = _HEADER.unpack_from(self._take(16), 0)
+
+        if magic_int != _MAGIC_INT:
+            raise ValueError(f"Invalid magic: {magic_int:#010x}")
+
+        if id_or_marker == END_MARKER:
+            return {'type': 'end', 'total_chunks': count}
+
+        if id_or_marker == ERROR_MARKER:
+            return {'type': 'error', 'message': bytes(self._take(count)).decode('utf-8')}
+
+        samples = _aligned_empty(count)
+        out = memoryview(samples).cast('B')
+        have = min(self._buffered(), len(out))
+        if have:
+            out[:have] = self._view[self._start:self._start + have]
+            self._start += have
+        if have < len(out):
+            _recv_exact_into(self.sock, out[have:])
+        return {
+            'type': 'chunk',
+            'id': id_or_marker,
+            'samples': samples,
+            'sample_rate': rate
+        }
+
+
+# --- Protocol v2 (opt-in) ---------------------------------------------
+#
+# Compact 8-byte framing: [magic:2][type:1][flags:1][count:4]. The
+# sample rate moves into a one-time HELLO message, halving per-chunk
+# header overhead. The flags byte of CHUNK messages carries the sample
+# format, so int16 PCM can travel untouched at 2 B/sample instead of
+# being upcast to float32 (4 B/sample) just for the wire. The default
+# 16-byte SPKR framing above remains the wire format the TypeScript
+# client speaks; use v2 only when both ends have negotiated it.
+
+PROTO_V2_MAGIC = 0x5053  # 'SP' little-endian
+_HEADER_V2 = struct.Struct('<HBBI')
+
+V2_CHUNK = 0
+V2_END = 1
+V2_ERROR = 2
+V2_HELLO = 3
+
+# CHUNK flags: sample format on the wire
+V2_FMT_F32 = 0  # float32 little-endian, [-1, 1]
+V2_FMT_S16 = 1  # int16 little-endian PCM
+
+
+class V2ChunkWriter:
+    """
+    Writer for the compact v2 framing. Sends HELLO on construction.
+
+    With sample_format=V2_FMT_S16, int16 PCM input is sent as-is -
+    half the bytes on the wire and no upcast allocation per chunk; the
+    reader normalizes to float32 on its side if it wants float.
+    """
+
+    def __init__(
+        self,
+        stream: Union[BinaryIO, socket.socket],
+        sample_rate: int = 24000,
+        sample_format: int = V2_FMT_F32
+    ):
+        self._adapter = _adapt(stream)
+        self.sample_rate = sample_rate
+        self.sample_format = sample_format
+        self._chunks_sent = 0
+        self._adapter.send_message(
+            _HEADER_V2.pack(PROTO_V2_MAGIC, V2_HELLO, 0, sample_rate))
+
+    def write_chunk(self, samples: np.ndarray) -> None:
+        if self.sample_format == V2_FMT_S16:
+            if samples.dtype == np.int16:
+                payload = np.ascontiguousarray(samples)
+            else:
+                # Float input: quantize once here rather than shipping
+                # twice the bytes. Clip first - TTS output overshoots
+                # +/-1.0 slightly, and a bare int16 cast wraps such a
+                # peak into a sign-flipped full-scale click.
+                payload = np.multiply(
+                    np.clip(samples, -1.0, 1.0), 32767.0,
+                    dtype=np.float32).astype(np.int16)
+        else:
+            payload = np.ascontiguousarray(samples, dtype=np.float32)
+        header = _HEADER_V2.pack(
+            PROTO_V2_MAGIC, V2_CHUNK, self.sample_format, len(payload))
+        self._adapter.send_message(header, payload)
+        self._chunks_sent += 1
+
+    def write_end(self) -> None:
+        self._adapter.send_message(
+            _HEADER_V2.pack(PROTO_V2_MAGIC, V2_END, 0, self._chunks_sent))
+
+    def write_error(self, message: str) -> None:
+        msg_bytes = message.encode('utf-8')
+        header = _HEADER_V2.pack(PROTO_V2_MAGIC, V2_ERROR, 0, len(msg_bytes))
+        self._adapter.send_message(header, msg_bytes)
+
+
+class V2ChunkReader:
+    """
+    Reader for the compact v2 framing. Caches the HELLO sample rate.
+
+    int16 chunks are normalized to float32 in [-1, 1] by default; pass
+    normalize=False to get the raw int16 array (e.g. for writing PCM
+    straight out without a float round-trip).
+    """
+
+    def __init__(
+        self,
+        stream: Union[BinaryIO, socket.socket],
+        normalize: bool = True
+    ):
+        self._adapter = _adapt(stream)
+        self.sample_rate = None
+        self.normalize = normalize
+        self._chunk_id = 0
+
+    def read_message(self) -> dict:
+        """Read one message; same result dicts as read_chunk."""
+        header = bytearray(8)
+        while True:
+            self._adapter.read_exact_into(header)
+            magic, msg_type, flags, count = _HEADER_V2.unpack_from(header, 0)
+
+            if magic != PROTO_V2_MAGIC:
+                raise ValueError(f"Invalid v2 magic: {magic:#06x}")
+
+            if msg_type == V2_HELLO:
+                self.sample_rate = count
+                continue
+
+            if msg_type == V2_END:
+                return {'type': 'end', 'total_chunks': count}
+
+            if msg_type == V2_ERROR:
+                msg_bytes = bytearray(count)
+                self._adapter.read_exact_into(msg_bytes)
+                return {'type': 'error', 'message': msg_bytes.decode('utf-8')}
+
+            if msg_type != V2_CHUNK:
+                raise ValueError(f"Unknown v2 message type: {msg_type}")
+
+            if flags == V2_FMT_S16:
+                samples = _aligned_empty(count, dtype=np.int16)
+                self._adapter.read_exact_into(memoryview(samples).cast('B'))
+                if self.normalize:
+                    samples = np.multiply(samples, _I16_SCALE, dtype=np.float32)
+            else:
+                samples = _aligned_empty(count)
+                self._adapter.read_exact_into(memoryview(samples).cast('B'))
+            chunk_id = self._chunk_id
+            self._chunk_id += 1
+            return {
+                'type': 'chunk',
+                'id': chunk_id,
+                'samples': samples,
+                'sample_rate': self.sample_rate
+            }
+
+
+def read_chunk(
+    stream: Union[BinaryIO, socket.socket],
+    raw: bool = False
+) -> dict:
     """
     Read a single message from the stream.
-    
+
+    Args:
+        stream: Socket or file-like object
+        raw: Return samples as a typed memoryview ('f') instead of a
+            numpy array. Useful for relays that only forward the data;
+            np.asarray(view) recovers an ndarray without copying.
+
     Returns:
         dict with 'type' key:
-        - type='chunk': id, samples (numpy), sample_rate
+        - type='chunk': id, samples (numpy or memoryview), sample_rate
         - type='end': total_chunks
         - type='error': message
     """
-    # Read header
-    if hasattr(stream, 'recv'):
-        header = b''
-        while len(header) < 16:
-            header += stream.recv(16 - len(header))
-    else:
-        header = stream.read(16)
-    
-    if len(header) < 16:
-        raise IOError("Incomplete header")
-    
-    magic, id_or_marker, count, rate = struct.unpack('<4sIII', header)
+    adapter = _adapt(stream)
+
+    # Read header into a pooled buffer (released once unpacked)
+    header = _acquire_header_buf()
+    try:
+        adapter.read_exact_into(header)
+        magic_int, id_or_marker, count, rate = _HEADER.unpack_from(header, 0)
+    finally:
+        _release_header_buf(header)
     
-    if magic != MAGIC:
-        raise ValueError(f"Invalid magic: {magic}")
+    if magic_int != _MAGIC_INT:
+        raise ValueError(f"Invalid magic: {magic_int:#010x}")
     
     # End marker
     if id_or_marker == END_MARKER:
@@ -132,25 +703,87 @@ def read_chunk(stream: Union[BinaryIO, socket.socket]) -> dict:
     
     # Error marker
     if id_or_marker == ERROR_MARKER:
-        if hasattr(stream, 'recv'):
-            msg_bytes = b''
-            while len(msg_bytes) < count:
-                msg_bytes += stream.recv(count - len(msg_bytes))
-        else:
-            msg_bytes = stream.read(count)
+        msg_bytes = bytearray(count)
+        adapter.read_exact_into(msg_bytes)
         return {'type': 'error', 'message': msg_bytes.decode('utf-8')}
-    
-    # Audio chunk
-    sample_bytes_len = count * 4
-    if hasattr(stream, 'recv'):
-        sample_bytes = b''
-        while len(sample_bytes) < sample_bytes_len:
-            sample_bytes += stream.recv(sample_bytes_len - len(sample_bytes))
+
+    # Audio chunk: receive directly into the destination buffer, no
+    # intermediate bytes object
+    if raw:
+        # Pure passthrough: skip ndarray construction entirely
+        sample_buf = bytearray(count * 4)
+        adapter.read_exact_into(sample_buf)
+        samples = memoryview(sample_buf).cast('f')
     else:
-        sample_bytes = stream.read(sample_bytes_len)
+        samples = _aligned_empty(count)
+        adapter.read_exact_into(memoryview(samples).cast('B'))
     
+    return {
+        'type': 'chunk',
+        'id': id_or_marker,
+        'samples': samples,
+        'sample_rate': rate
+    }
+
+
+# --- asyncio variants -------------------------------------------------
+#
+# For multi-client fanout a blocking sendall on one slow consumer
+# stalls every other stream. These variants ride asyncio's StreamWriter
+# backpressure instead: write() queues, drain() yields until the
+# transport's buffer empties.
+
+async def write_chunk_async(
+    writer: 'asyncio.StreamWriter',
+    chunk_id: int,
+    samples: np.ndarray,
+    sample_rate: int = 24000
+) -> None:
+    """Async write_chunk; awaits drain() for backpressure."""
+    samples_f32 = np.ascontiguousarray(samples, dtype=np.float32)
+    writer.write(_HEADER.pack(_MAGIC_INT, chunk_id, len(samples_f32), sample_rate))
+    writer.write(memoryview(samples_f32).cast('B'))
+    await writer.drain()
+
+
+async def write_end_async(
+    writer: 'asyncio.StreamWriter',
+    total_chunks: int
+) -> None:
+    """Async write_end."""
+    writer.write(_HEADER.pack(_MAGIC_INT, END_MARKER, total_chunks, 0))
+    await writer.drain()
+
+
+async def write_error_async(
+    writer: 'asyncio.StreamWriter',
+    message: str
+) -> None:
+    """Async write_error."""
+    msg_bytes = message.encode('utf-8')
+    writer.write(_HEADER.pack(_MAGIC_INT, ERROR_MARKER, len(msg_bytes), 0))
+    writer.write(msg_bytes)
+    await writer.drain()
+
+
+async def read_chunk_async(reader: 'asyncio.StreamReader') -> dict:
+    """Async read_chunk; same result dicts."""
+    header = await reader.readexactly(16)
+    magic_int, id_or_marker, count, rate = _HEADER.unpack_from(header, 0)
+
+    if magic_int != _MAGIC_INT:
+        raise ValueError(f"Invalid magic: {magic_int:#010x}")
+
+    if id_or_marker == END_MARKER:
+        return {'type': 'end', 'total_chunks': count}
+
+    if id_or_marker == ERROR_MARKER:
+        msg_bytes = await reader.readexactly(count)
+        return {'type': 'error', 'message': msg_bytes.decode('utf-8')}
+
+    sample_bytes = await reader.readexactly(count * 4)
     samples = np.frombuffer(sample_bytes, dtype=np.float32)
-    
+
     return {
         'type': 'chunk',
         'id': id_or_marker,
@@ -12,15 +12,21 @@ Methods:
   - shutdown: Stop server gracefully
 """
 
+import glob
 import json
 import os
-import select
+import re
+import selectors
+import shutil
 import signal
 import socket
 import sys
 import tempfile
+import threading
 import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -28,6 +34,36 @@ from typing import Any, Dict, Optional
 # This allows the daemon to survive after the spawning Node.js process terminates
 signal.signal(signal.SIGPIPE, signal.SIG_IGN)
 
+# Set on SIGTERM so a supervisor stop drains cleanly: checked between
+# selector passes and between chunks, so in-flight generation returns
+# what it has and the socket file is unlinked on the way out
+_stop_event = threading.Event()
+
+# Heavy dependencies resolved at import time so the cost lands during
+# daemon warm-up instead of first-request latency. Each is guarded: if
+# one is missing the server still imports, health and list-models keep
+# working, and generation reports a clear error.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import scipy.io.wavfile as wavfile
+except ImportError:
+    wavfile = None
+
+try:
+    from mlx_audio.tts.generate import generate_audio, load_model as mlx_load_model
+except ImportError:
+    generate_audio = None
+    mlx_load_model = None
+
+try:
+    from binary_protocol import write_chunk, write_end, write_error, _send_vectored
+except ImportError:
+    write_chunk = write_end = write_error = _send_vectored = None
+
 # Configuration
 SOCKET_PATH = os.path.expanduser("~/.chatter/speak.sock")
 TEMP_DIR = tempfile.gettempdir()
@@ -37,9 +73,150 @@ IDLE_TIMEOUT_SECONDS = 60 * 60  # 1 hour - auto-shutdown if no TTS requests
 # Chatterbox can destabilize on long sentences, so we split aggressively
 MAX_CHUNK_CHARS = 250
 
-# Lazy-loaded model
+# Kernel send/receive buffer size for accepted connections. AF_UNIX
+# has no Nagle, but the default buffers are small enough that a long
+# chunk's float32 payload takes several kernel copies per sendall;
+# 2 MiB fits a whole chunk in one. Override with SPEAK_SOCK_BUF_BYTES.
+SOCK_BUF_BYTES = int(os.environ.get("SPEAK_SOCK_BUF_BYTES", 2 * 1024 * 1024))
+
+# Hard cap on a single JSON request line; a client that never sends a
+# newline should get an error, not an unbounded buffer
+MAX_LINE_BYTES = 1 << 20
+
+# Worker threads for chunk synthesis in handle_generate. Sequential by
+# default: MLX kernels usually saturate the GPU, and two in-flight
+# generations can contend. Set SPEAK_SYNTH_WORKERS=2 on machines where
+# overlapping chunks measures faster.
+SYNTH_WORKERS = int(os.environ.get("SPEAK_SYNTH_WORKERS", "1"))
+
+# Lazy-loaded model. The lock serializes loads: the startup warm-up
+# thread and a request that arrives before it finishes must not both
+# call mlx_load_model.
 _model = None
 _model_name = None
+_model_load_lock = threading.Lock()
+
+# mlx-audio version, resolved once on the first health check;
+# importlib.metadata re-reads package METADATA from disk on every call
+_mlx_audio_version = None
+
+# Reciprocal scales for PCM -> float32 normalization; a fused multiply
+# is several times cheaper than an elementwise divide
+_I16_SCALE = 1.0 / 32768.0
+_I32_SCALE = 1.0 / 2147483648.0
+
+# Chunk-split patterns, compiled once; the punctuation stays attached
+# to the preceding sentence/clause
+_SENT_RE = re.compile(r'(?<=[.!?])\s+')
+_CLAUSE_RE = re.compile(r'(?<=[,;:\-])\s+')
+
+# Matches exactly the cases ' '.join(text.split()) would change:
+# leading/trailing whitespace, runs of two, or any non-space whitespace
+_WS_MESSY_RE = re.compile(r'^\s|\s$|\s\s|[^\S ]')
+
+# Sink for the model's verbose output, opened once per process. A
+# per-call StringIO would buffer everything the model prints in RAM
+# just to throw it away; devnull discards it for free. TQDM_DISABLE
+# stops mlx_audio's progress bars from even rendering.
+os.environ.setdefault("TQDM_DISABLE", "1")
+_DEVNULL = open(os.devnull, "w")
+
+# Refcounted FD-level silencer shared by all generation paths
+_silence_lock = threading.Lock()
+_silence_depth = 0
+_saved_fds = None
+
+
+@contextmanager
+def _silence():
+    """
+    Point fds 1 and 2 at /dev/null for the duration of the block.
+
+    redirect_stdout only swaps sys.stdout; the model libraries also
+    write through C-level printf and tqdm, which reach the real file
+    descriptors. dup2 catches those too. A depth count makes this safe
+    for overlapping generations on worker threads: the real fds are
+    restored only when the last one leaves.
+    """
+    global _silence_depth, _saved_fds
+    with _silence_lock:
+        if _silence_depth == 0:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            _saved_fds = (os.dup(1), os.dup(2))
+            os.dup2(_DEVNULL.fileno(), 1)
+            os.dup2(_DEVNULL.fileno(), 2)
+        _silence_depth += 1
+    try:
+        yield
+    finally:
+        with _silence_lock:
+            _silence_depth -= 1
+            if _silence_depth == 0:
+                so, se = _saved_fds
+                os.dup2(so, 1)
+                os.dup2(se, 2)
+                os.close(so)
+                os.close(se)
+                _saved_fds = None
+
+# Worker pool for filesystem cleanup. MLX releases the GIL during
+# inference, so unlinking a finished chunk's temp file on this pool
+# overlaps with the next chunk's generation instead of serializing
+# with it.
+_io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="speak-io")
+
+
+def _remove_later(path: str) -> None:
+    """Unlink path on the I/O pool; missing files are ignored."""
+    def _rm():
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    _io_pool.submit(_rm)
+
+# soundfile (libsndfile) reads and writes WAV via a C call with no
+# Python-level dtype validation or copy; scipy remains the fallback
+# and still serves the mmap metadata-only reads, which soundfile has
+# no equivalent for
+try:
+    import soundfile as _sf
+except ImportError:
+    _sf = None
+
+
+def _read_wav(path: str) -> tuple:
+    """Read a whole WAV; returns (sample_rate, int16 samples)."""
+    if _sf is not None:
+        data, sr = _sf.read(path, dtype='int16')
+        return sr, data
+    return wavfile.read(path)
+
+
+def _write_wav(path: str, sample_rate: int, samples) -> None:
+    """Write samples as a PCM-16 WAV."""
+    if _sf is not None:
+        _sf.write(path, samples, sample_rate, subtype='PCM_16')
+        return
+    wavfile.write(path, sample_rate, samples)
+
+
+# orjson serializes straight to bytes several times faster than stdlib
+# json; fall back silently since it is an optional speedup, not a
+# dependency
+try:
+    import orjson
+
+    def _dumps(obj: Dict) -> bytes:
+        return orjson.dumps(obj)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Dict) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    _loads = json.loads
 
 
 def split_text_into_chunks(text: str, max_chars: int = MAX_CHUNK_CHARS) -> list:
@@ -49,10 +226,11 @@ def split_text_into_chunks(text: str, max_chars: int = MAX_CHUNK_CHARS) -> list:
     Splits on sentence boundaries (. ! ?) first, then further splits
     long sentences on clause boundaries (, ; :) if needed.
     """
-    import re
-
-    # Normalize whitespace
-    text = ' '.join(text.split())
+    # Normalize whitespace - but only when there is something to
+    # normalize. Short clean prompts (the dominant interactive case)
+    # skip the full-text split/join pass entirely.
+    if _WS_MESSY_RE.search(text) is not None:
+        text = ' '.join(text.split())
 
     if len(text) <= max_chars:
         return [text]
@@ -60,58 +238,83 @@ def split_text_into_chunks(text: str, max_chars: int = MAX_CHUNK_CHARS) -> list:
     chunks = []
 
     # First split on sentence endings
-    # Keep the punctuation with the sentence
-    sentences = re.split(r'(?<=[.!?])\s+', text)
+    sentences = _SENT_RE.split(text)
+
+    # Accumulate pieces in a list with a running length; joining only
+    # on flush avoids re-copying the growing chunk on every append.
+    # Whitespace was already normalized above, so no per-piece strip.
+    current_parts: list = []
+    current_len = 0
 
-    current_chunk = ""
     for sentence in sentences:
-        sentence = sentence.strip()
         if not sentence:
             continue
 
+        need = len(sentence) + (1 if current_parts else 0)
+
         # If adding this sentence would exceed limit
-        if len(current_chunk) + len(sentence) + 1 > max_chars:
+        if current_len + need > max_chars:
             # Save current chunk if not empty
-            if current_chunk:
-                chunks.append(current_chunk.strip())
-                current_chunk = ""
+            if current_parts:
+                chunks.append(" ".join(current_parts))
+                current_parts = []
+                current_len = 0
 
             # If single sentence is too long, split on clause boundaries
             if len(sentence) > max_chars:
                 # Split on commas, semicolons, colons, or dashes
-                clauses = re.split(r'(?<=[,;:\-])\s+', sentence)
-                for clause in clauses:
-                    clause = clause.strip()
+                for clause in _CLAUSE_RE.split(sentence):
                     if not clause:
                         continue
-                    if len(current_chunk) + len(clause) + 1 > max_chars:
-                        if current_chunk:
-                            chunks.append(current_chunk.strip())
-                        current_chunk = clause
+                    need = len(clause) + (1 if current_parts else 0)
+                    if current_len + need > max_chars:
+                        if current_parts:
+                            chunks.append(" ".join(current_parts))
+                        current_parts = [clause]
+                        current_len = len(clause)
                     else:
-                        current_chunk = (current_chunk + " " + clause).strip() if current_chunk else clause
+                        current_parts.append(clause)
+                        current_len += need
             else:
-                current_chunk = sentence
+                current_parts = [sentence]
+                current_len = len(sentence)
         else:
-            current_chunk = (current_chunk + " " + sentence).strip() if current_chunk else sentence
+            current_parts.append(sentence)
+            current_len += need
 
     # Don't forget the last chunk
-    if current_chunk:
-        chunks.append(current_chunk.strip())
+    if current_parts:
+        chunks.append(" ".join(current_parts))
 
     return chunks
 
 
+# Minimum level that actually gets encoded and written. Debug lines
+# are emitted per chunk on the streaming paths, so skipping their dict
+# and JSON build entirely is worth a module-level gate. Set
+# SPEAK_LOG_LEVEL=debug to get them back.
+_LOG_LEVELS = {"debug": 10, "info": 20, "warn": 30, "error": 40}
+_LOG_LEVEL = _LOG_LEVELS.get(os.environ.get("SPEAK_LOG_LEVEL", "info").lower(), 20)
+
+
 def log(level: str, message: str, **data):
     """Simple logging to stderr"""
-    entry = {"level": level, "message": message, "timestamp": time.time(), **data}
+    if _LOG_LEVELS.get(level, 20) < _LOG_LEVEL:
+        return
+    entry = {"level": level, "message": message, "timestamp": time.time_ns() / 1e9, **data}
     try:
-        print(json.dumps(entry), file=sys.stderr, flush=True)
+        sys.stderr.buffer.write(_dumps(entry) + b"\n")
+        sys.stderr.buffer.flush()
     except BrokenPipeError:
         # Parent process exited, stderr pipe is closed - continue silently
         pass
 
 
+def _send(conn, obj: Dict) -> None:
+    """Serialize obj as one compact JSON line and send it completely."""
+    conn.sendall(_dumps(obj) + b"\n")
+
+
 def load_model(model_name: str, request_id: str = None, conn = None):
     """
     Load TTS model (lazy loading).
@@ -123,6 +326,18 @@ def load_model(model_name: str, request_id: str = None, conn = None):
     if _model is not None and _model_name == model_name:
         return _model, 0.0  # Already loaded, no load time
 
+    with _model_load_lock:
+        return _load_model_locked(model_name, request_id, conn)
+
+
+def _load_model_locked(model_name: str, request_id: str = None, conn = None):
+    global _model, _model_name
+
+    # Re-check: another thread may have finished this load while we
+    # waited on the lock
+    if _model is not None and _model_name == model_name:
+        return _model, 0.0
+
     # Send status: loading_model
     if request_id and conn:
         try:
@@ -133,14 +348,16 @@ def load_model(model_name: str, request_id: str = None, conn = None):
                     "model": model_name,
                 }
             }
-            conn.send((json.dumps(status_msg) + "\n").encode("utf-8"))
+            _send(conn, status_msg)
         except:
             pass
 
+    if mlx_load_model is None:
+        raise RuntimeError("mlx_audio is not installed")
+
     log("info", f"Loading model: {model_name}")
     start = time.time()
 
-    from mlx_audio.tts.generate import load_model as mlx_load_model
     _model = mlx_load_model(Path(model_name), lazy=False)
     _model_name = model_name
 
@@ -157,27 +374,30 @@ def load_model(model_name: str, request_id: str = None, conn = None):
                     "load_time_ms": int(elapsed * 1000),
                 }
             }
-            conn.send((json.dumps(status_msg) + "\n").encode("utf-8"))
+            _send(conn, status_msg)
         except:
             pass
 
     return _model, elapsed
 
 
-def handle_health(request_id: str, params: Dict) -> Dict:
+def handle_health(request_id: str, params: Dict, conn=None) -> Dict:
     """Handle health check request"""
-    from importlib.metadata import version
+    global _mlx_audio_version
+    if _mlx_audio_version is None:
+        from importlib.metadata import version
+        _mlx_audio_version = version("mlx-audio")
     return {
         "id": request_id,
         "result": {
             "status": "healthy",
-            "mlx_audio_version": version("mlx-audio"),
+            "mlx_audio_version": _mlx_audio_version,
             "model_loaded": _model_name,
         }
     }
 
 
-def handle_list_models(request_id: str, params: Dict) -> Dict:
+def handle_list_models(request_id: str, params: Dict, conn=None) -> Dict:
     """List available Chatterbox models"""
     models = [
         {"name": "mlx-community/chatterbox-turbo-8bit", "description": "8-bit quantized, fastest"},
@@ -192,12 +412,90 @@ def handle_list_models(request_id: str, params: Dict) -> Dict:
     }
 
 
+# Pool of mono concatenation buffers keyed by (capacity, dtype).
+# Capacities are rounded up to powers of two so back-to-back long
+# generations reuse the same tens-of-MB allocation instead of
+# re-mmapping it from the allocator every request.
+_AUDIO_POOL: Dict[tuple, list] = {}
+_AUDIO_POOL_MAX_PER_KEY = 2
+
+# Chunk joining: flow-matching models end chunks at arbitrary phase,
+# so butting them together clicks. A short linear fade-out on each
+# chunk's tail plus a beat of silence between chunks removes the
+# discontinuity without any post-processing pass.
+FADE_OUT_SECONDS = 0.05
+CHUNK_GAP_SECONDS = 0.15
+
+# Silence arrays cached by (rate, channels, dtype); read-only, shared
+_SILENCE_CACHE: Dict[tuple, Any] = {}
+
+
+def _fade_tail(audio_data, sr: int):
+    """Apply an in-place linear fade-out to the chunk's last 50 ms."""
+    tail = min(int(FADE_OUT_SECONDS * sr), len(audio_data))
+    if tail > 1:
+        ramp = np.linspace(1.0, 0.0, tail, dtype=np.float32)
+        if audio_data.ndim > 1:
+            ramp = ramp[:, None]
+        audio_data[-tail:] = (audio_data[-tail:] * ramp).astype(audio_data.dtype)
+    return audio_data
+
+
+def _chunk_gap(sr: int, like):
+    """Shared silence array matching the chunk's rate, shape and dtype."""
+    key = (sr, like.shape[1:], like.dtype.str)
+    gap = _SILENCE_CACHE.get(key)
+    if gap is None:
+        gap = np.zeros((int(CHUNK_GAP_SECONDS * sr),) + like.shape[1:], dtype=like.dtype)
+        _SILENCE_CACHE[key] = gap
+    return gap
+
+
+def _concatenate_chunks(all_audio: list):
+    """
+    Merge chunk arrays into one output buffer drawn from the pool.
+
+    Sums the sample counts first, takes (or allocates) a power-of-two
+    buffer, and copies each chunk into its slice - a single pass over
+    the audio. Returns a length-total view; hand it back with
+    _release_audio_buf once written out. Multi-channel audio falls
+    back to a plain allocation.
+    """
+    total = sum(len(a) for a in all_audio)
+    first = all_audio[0]
+    if first.ndim == 1 and total:
+        cap = 1 << (total - 1).bit_length()
+        stack = _AUDIO_POOL.get((cap, first.dtype.str))
+        base = stack.pop() if stack else np.empty(cap, dtype=first.dtype)
+        out = base[:total]
+    else:
+        out = np.empty((total,) + first.shape[1:], dtype=first.dtype)
+    offset = 0
+    for a in all_audio:
+        out[offset:offset + len(a)] = a
+        offset += len(a)
+    return out
+
+
+def _release_audio_buf(arr) -> None:
+    """Return a _concatenate_chunks result to the pool for reuse."""
+    base = arr.base if arr.base is not None else arr
+    n = len(base)
+    # Only pooled buffers are 1-D with power-of-two capacity
+    if base.ndim != 1 or n == 0 or n & (n - 1):
+        return
+    stack = _AUDIO_POOL.setdefault((n, base.dtype.str), [])
+    if len(stack) < _AUDIO_POOL_MAX_PER_KEY:
+        stack.append(base)
+
+
 def handle_generate(request_id: str, params: Dict, conn=None) -> Dict:
     """
-    Generate TTS audio (non-streaming) with progressive chunk saving.
-    
-    Chunks are saved to disk immediately after generation so partial
-    output is preserved if generation is interrupted.
+    Generate TTS audio (non-streaming) with in-memory chunk handoff.
+
+    Each chunk's audio is read into memory right after generation and
+    its temp file removed, so the final WAV is written exactly once;
+    partial output is recovered from memory if generation fails.
     """
     text = params.get("text", "")
     if not text:
@@ -213,10 +511,10 @@ def handle_generate(request_id: str, params: Dict, conn=None) -> Dict:
     if stream and conn:
         return handle_generate_stream(request_id, params, conn)
 
+    req_dir = None
     try:
-        from mlx_audio.tts.generate import generate_audio
-        import numpy as np
-        import scipy.io.wavfile as wavfile
+        if generate_audio is None:
+            return {"id": request_id, "error": {"code": 2, "message": "mlx_audio is not installed"}}
 
         # Send status: check if model needs loading
         needs_model_load = _model_name != model_name
@@ -229,7 +527,7 @@ def handle_generate(request_id: str, params: Dict, conn=None) -> Dict:
                         "model": model_name,
                     }
                 }
-                conn.send((json.dumps(status_msg) + "\n").encode("utf-8"))
+                _send(conn, status_msg)
             except:
                 pass
 
@@ -242,93 +540,163 @@ def handle_generate(request_id: str, params: Dict, conn=None) -> Dict:
         start = time.time()
         timestamp = int(time.time() * 1000)
 
-        # Capture stdout/stderr to suppress verbose output and prevent broken pipe errors
-        import io
-        from contextlib import redirect_stdout, redirect_stderr
+        # Chunk WAVs go in a per-request directory: the glob scans a
+        # near-empty dir instead of the shared temp dir, and cleanup
+        # is a single rmtree no matter how the request ends
+        req_dir = tempfile.mkdtemp(prefix=f"speak_{timestamp}_")
+
+        # Discard stdout/stderr to suppress verbose output and prevent broken pipe errors
 
-        # Progressive saving: track saved chunk files instead of in-memory audio
-        saved_chunk_files: list[str] = []
+        # In-memory handoff: each chunk WAV is read back once, kept as
+        # a numpy array, and its file deleted immediately. Partial
+        # output can still be recovered from RAM on failure.
+        all_audio: list = []
         sample_rate = None
         chunks_generated = 0
 
         chars_done = 0
-        
-        for i, chunk in enumerate(chunks):
-            chunk_prefix = os.path.join(TEMP_DIR, f"speak_{timestamp}_chunk{i}")
+        last_progress_ts = 0.0
+
+        # Resolve the voice-clone reference once; the answer cannot
+        # change mid-request and stat(2) per chunk adds up
+        ref_audio = voice if voice and os.path.exists(voice) else None
+
+        # Opt-in parallel synthesis: MLX releases the GIL inside its
+        # kernels, so independent chunks can overlap when the GPU has
+        # headroom. Progress events are skipped here - completion
+        # order is not chunk order - but results are collected in
+        # order via map.
+        if SYNTH_WORKERS > 1 and total_chunks > 1:
+            def _synth_one(item):
+                idx, chunk_text = item
+                prefix = os.path.join(req_dir, f"chunk{idx}")
+                with _silence():
+                    generate_audio(
+                        text=chunk_text,
+                        model=model_name,
+                        ref_audio=ref_audio,
+                        temperature=temperature,
+                        speed=speed,
+                        file_prefix=prefix,
+                        audio_format="wav",
+                        play=False,
+                        verbose=False,
+                        stream=False,
+                        max_tokens=2400,
+                    )
+                return [_read_wav(p) for p in sorted(glob.iglob(prefix + "*.wav"))]
+
+            with ThreadPoolExecutor(max_workers=SYNTH_WORKERS) as synth_pool:
+                for reads in synth_pool.map(_synth_one, enumerate(chunks)):
+                    for sr, audio_data in reads:
+                        if sample_rate is None:
+                            sample_rate = sr
+                        if all_audio:
+                            all_audio.append(_chunk_gap(sr, audio_data))
+                        all_audio.append(_fade_tail(audio_data, sr))
+                        chunks_generated += 1
+        else:
+            for i, chunk in enumerate(chunks):
+                if _stop_event.is_set():
+                    log("info", "Stop requested - finishing with chunks generated so far")
+                    break
+
+                chunk_prefix = os.path.join(req_dir, f"chunk{i}")
 
-            log("debug", f"Generating chunk {i+1}/{total_chunks}: {len(chunk)} chars")
+                log("debug", f"Generating chunk {i+1}/{total_chunks}: {len(chunk)} chars")
             
-            # Send progress event if connection available
-            if conn:
-                progress_msg = {
-                    "id": request_id,
-                    "progress": {
-                        "chunk": i + 1,
-                        "total_chunks": total_chunks,
-                        "chars_done": chars_done,
-                        "chars_total": len(text),
+                # Send progress event if connection available, rate-limited
+                # to one per 100 ms (plus the final chunk): the client only
+                # redraws a spinner, so per-chunk events are wasted encodes
+                # and write syscalls on long documents
+                now = time.time()
+                if conn and (i == total_chunks - 1 or now - last_progress_ts > 0.1):
+                    last_progress_ts = now
+                    progress_msg = {
+                        "id": request_id,
+                        "progress": {
+                            "chunk": i + 1,
+                            "total_chunks": total_chunks,
+                            "chars_done": chars_done,
+                            "chars_total": len(text),
+                        }
                     }
-                }
-                try:
-                    conn.send((json.dumps(progress_msg) + "\n").encode("utf-8"))
-                except:
-                    pass  # Ignore progress send errors
+                    try:
+                        _send(conn, progress_msg)
+                    except:
+                        pass  # Ignore progress send errors
+
+                with _silence():
+                    generate_audio(
+                        text=chunk,
+                        model=model_name,
+                        ref_audio=ref_audio,
+                        temperature=temperature,
+                        speed=speed,
+                        file_prefix=chunk_prefix,
+                        audio_format="wav",
+                        play=False,
+                        verbose=False,
+                        stream=False,
+                        max_tokens=2400,
+                    )
+
+                # Find and save the generated chunk file(s)
+                chunk_files = sorted(glob.iglob(chunk_prefix + "*.wav"))
+
+                # Single-chunk fast path (short interactive prompts): the
+                # generated WAV already is the final audio - rename it
+                # instead of decoding and re-encoding the samples
+                if total_chunks == 1 and len(chunk_files) == 1:
+                    chunk_path = chunk_files[0]
+                    sr, audio_data = wavfile.read(chunk_path, mmap=True)
+                    sample_rate = sr
+                    duration = len(audio_data) / sr
+                    del audio_data  # Release the mmap before the rename
 
-            with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
-                generate_audio(
-                    text=chunk,
-                    model=model_name,
-                    ref_audio=voice if voice and os.path.exists(voice) else None,
-                    temperature=temperature,
-                    speed=speed,
-                    file_prefix=chunk_prefix,
-                    audio_format="wav",
-                    play=False,
-                    verbose=False,
-                    stream=False,
-                    max_tokens=2400,
-                )
+                    output_path = os.path.join(TEMP_DIR, f"speak_{timestamp}.wav")
+                    os.replace(chunk_path, output_path)
 
-            # Find and save the generated chunk file(s)
-            chunk_files = sorted([
-                f for f in os.listdir(TEMP_DIR)
-                if f.startswith(f"speak_{timestamp}_chunk{i}") and f.endswith(".wav")
-            ])
-
-            for cf in chunk_files:
-                chunk_path = os.path.join(TEMP_DIR, cf)
-                # Read to get sample rate (needed for concatenation)
-                sr, _ = wavfile.read(chunk_path)
-                if sample_rate is None:
-                    sample_rate = sr
-                # Keep chunk file on disk for progressive saving
-                saved_chunk_files.append(chunk_path)
-                chunks_generated += 1
-                chars_done += len(chunk)
-                log("debug", f"Saved chunk {chunks_generated} to {chunk_path}")
+                    elapsed = time.time() - start
+                    rtf = elapsed / duration if duration > 0 else 0
+                    log("info", f"Generated {duration:.2f}s audio in {elapsed:.2f}s (RTF: {rtf:.2f}, single chunk)")
 
-        if not saved_chunk_files:
-            return {"id": request_id, "error": {"code": 3, "message": "No audio generated"}}
+                    return {
+                        "id": request_id,
+                        "result": {
+                            "audio_path": output_path,
+                            "duration": duration,
+                            "rtf": rtf,
+                            "sample_rate": sample_rate,
+                            "complete": True,
+                            "chunks_generated": 1,
+                            "chunks_total": 1,
+                        }
+                    }
 
-        # Concatenate all saved chunks
-        all_audio = []
-        for chunk_path in saved_chunk_files:
-            sr, audio_data = wavfile.read(chunk_path)
-            all_audio.append(audio_data)
+                for chunk_path in chunk_files:
+                    # Read once into memory, then drop the temp file
+                    sr, audio_data = _read_wav(chunk_path)
+                    if sample_rate is None:
+                        sample_rate = sr
+                    if all_audio:
+                        all_audio.append(_chunk_gap(sr, audio_data))
+                    all_audio.append(_fade_tail(audio_data, sr))
+                    chunks_generated += 1
+                    chars_done += len(chunk)
+                    _remove_later(chunk_path)
+                    log("debug", f"Generated chunk {chunks_generated} ({len(audio_data)} samples)")
+
+        if not all_audio:
+            return {"id": request_id, "error": {"code": 3, "message": "No audio generated"}}
 
-        combined_audio = np.concatenate(all_audio)
+        # Concatenate in memory and write the final WAV exactly once
+        combined_audio = _concatenate_chunks(all_audio)
         duration = len(combined_audio) / sample_rate
 
-        # Write combined audio
         output_path = os.path.join(TEMP_DIR, f"speak_{timestamp}.wav")
-        wavfile.write(output_path, sample_rate, combined_audio)
-
-        # Clean up individual chunk files
-        for chunk_path in saved_chunk_files:
-            try:
-                os.remove(chunk_path)
-            except:
-                pass
+        _write_wav(output_path, sample_rate, combined_audio)
+        _release_audio_buf(combined_audio)
 
         elapsed = time.time() - start
         rtf = elapsed / duration if duration > 0 else 0
@@ -342,7 +710,7 @@ def handle_generate(request_id: str, params: Dict, conn=None) -> Dict:
                 "duration": duration,
                 "rtf": rtf,
                 "sample_rate": sample_rate,
-                "complete": True,
+                "complete": chunks_generated == total_chunks,
                 "chunks_generated": chunks_generated,
                 "chunks_total": total_chunks,
             }
@@ -353,48 +721,32 @@ def handle_generate(request_id: str, params: Dict, conn=None) -> Dict:
         
         # Attempt to save partial output if any chunks were generated
         try:
-            if saved_chunk_files:
-                import numpy as np
-                import scipy.io.wavfile as wavfile
-                
-                all_audio = []
-                for chunk_path in saved_chunk_files:
-                    if os.path.exists(chunk_path):
-                        sr, audio_data = wavfile.read(chunk_path)
-                        all_audio.append(audio_data)
-                
-                if all_audio:
-                    combined_audio = np.concatenate(all_audio)
-                    duration = len(combined_audio) / sample_rate if sample_rate else 0
-                    
-                    output_path = os.path.join(TEMP_DIR, f"speak_{timestamp}_partial.wav")
-                    wavfile.write(output_path, sample_rate, combined_audio)
-                    
-                    # Clean up chunks
-                    for chunk_path in saved_chunk_files:
-                        try:
-                            os.remove(chunk_path)
-                        except:
-                            pass
-                    
-                    elapsed = time.time() - start
-                    rtf = elapsed / duration if duration > 0 else 0
-                    
-                    log("info", f"Saved partial output: {duration:.2f}s audio, {chunks_generated}/{total_chunks} chunks")
-                    
-                    return {
-                        "id": request_id,
-                        "result": {
-                            "audio_path": output_path,
-                            "duration": duration,
-                            "rtf": rtf,
-                            "sample_rate": sample_rate,
-                            "complete": False,
-                            "chunks_generated": chunks_generated,
-                            "chunks_total": total_chunks,
-                            "reason": str(e),
-                        }
+            if all_audio:
+                combined_audio = _concatenate_chunks(all_audio)
+                duration = len(combined_audio) / sample_rate if sample_rate else 0
+
+                output_path = os.path.join(TEMP_DIR, f"speak_{timestamp}_partial.wav")
+                _write_wav(output_path, sample_rate, combined_audio)
+                _release_audio_buf(combined_audio)
+
+                elapsed = time.time() - start
+                rtf = elapsed / duration if duration > 0 else 0
+
+                log("info", f"Saved partial output: {duration:.2f}s audio, {chunks_generated}/{total_chunks} chunks")
+
+                return {
+                    "id": request_id,
+                    "result": {
+                        "audio_path": output_path,
+                        "duration": duration,
+                        "rtf": rtf,
+                        "sample_rate": sample_rate,
+                        "complete": False,
+                        "chunks_generated": chunks_generated,
+                        "chunks_total": total_chunks,
+                        "reason": str(e),
                     }
+                }
         except Exception as partial_error:
             log("error", f"Failed to save partial output: {partial_error}")
         
@@ -402,6 +754,9 @@ def handle_generate(request_id: str, params: Dict, conn=None) -> Dict:
             "id": request_id,
             "error": {"code": 2, "message": str(e)}
         }
+    finally:
+        if req_dir:
+            _io_pool.submit(shutil.rmtree, req_dir, True)
 
 
 def handle_stream_binary(request_id: str, params: Dict, conn) -> None:
@@ -412,8 +767,6 @@ def handle_stream_binary(request_id: str, params: Dict, conn) -> None:
     Protocol: After receiving JSON request, server switches to binary protocol
     for response. Uses SPKR binary format for audio chunks.
     """
-    from binary_protocol import write_chunk, write_end, write_error
-    
     text = params.get("text", "")
     if not text:
         write_error(conn, "No text provided")
@@ -423,13 +776,12 @@ def handle_stream_binary(request_id: str, params: Dict, conn) -> None:
     temperature = params.get("temperature", 0.5)
     speed = params.get("speed", 1.0)
     voice = params.get("voice")
-    
+
+    req_dir = None
     try:
-        from mlx_audio.tts.generate import generate_audio
-        import scipy.io.wavfile as wavfile
-        import numpy as np
-        import io
-        from contextlib import redirect_stdout, redirect_stderr
+        if generate_audio is None:
+            write_error(conn, "mlx_audio is not installed")
+            return
 
         # Split text into chunks to prevent model destabilization
         chunks = split_text_into_chunks(text)
@@ -439,21 +791,33 @@ def handle_stream_binary(request_id: str, params: Dict, conn) -> None:
         start = time.time()
         
         timestamp = int(time.time() * 1000)
+        req_dir = tempfile.mkdtemp(prefix=f"speak_bin_{timestamp}_")
         total_samples = 0
         chunk_id = 0
         sample_rate = 24000  # Default, will be updated from actual audio
-        
+
+        # Scratch buffer for float32 conversion, grown on demand and
+        # reused across chunks; write_chunk sends synchronously, so
+        # the buffer is free again by the next iteration
+        f32_buf = np.empty(48000, dtype=np.float32)
+
+        # Stat the voice reference once instead of per chunk
+        ref_audio = voice if voice and os.path.exists(voice) else None
+
         for i, text_chunk in enumerate(chunks):
-            chunk_prefix = os.path.join(TEMP_DIR, f"speak_bin_{timestamp}_chunk{i}")
+            if _stop_event.is_set():
+                break
+
+            chunk_prefix = os.path.join(req_dir, f"chunk{i}")
             
             log("debug", f"Generating text chunk {i+1}/{len(chunks)}: {len(text_chunk)} chars")
             
             # Generate audio (still needs file I/O internally, but we read and send bytes)
-            with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+            with _silence():
                 generate_audio(
                     text=text_chunk,
                     model=model_name,
-                    ref_audio=voice if voice and os.path.exists(voice) else None,
+                    ref_audio=ref_audio,
                     temperature=temperature,
                     speed=speed,
                     file_prefix=chunk_prefix,
@@ -465,23 +829,28 @@ def handle_stream_binary(request_id: str, params: Dict, conn) -> None:
                 )
             
             # Find generated file(s)
-            chunk_files = sorted([
-                f for f in os.listdir(TEMP_DIR)
-                if f.startswith(f"speak_bin_{timestamp}_chunk{i}") and f.endswith(".wav")
-            ])
+            chunk_files = sorted(glob.iglob(chunk_prefix + "*.wav"))
             
-            for cf in chunk_files:
-                chunk_path = os.path.join(TEMP_DIR, cf)
+            for chunk_path in chunk_files:
                 try:
                     # Read audio as numpy array
-                    sr, audio_data = wavfile.read(chunk_path)
+                    sr, audio_data = _read_wav(chunk_path)
                     sample_rate = sr
                     
-                    # Convert to float32 normalized [-1, 1]
-                    if audio_data.dtype == np.int16:
-                        samples = audio_data.astype(np.float32) / 32768.0
+                    # Convert to float32 normalized [-1, 1] in one
+                    # fused cast-and-multiply pass, into the reused
+                    # scratch buffer (no per-chunk allocation)
+                    if audio_data.ndim == 1 and audio_data.dtype in (np.int16, np.int32):
+                        n = len(audio_data)
+                        if n > len(f32_buf):
+                            f32_buf = np.empty(n * 2, dtype=np.float32)
+                        samples = f32_buf[:n]
+                        scale = _I16_SCALE if audio_data.dtype == np.int16 else _I32_SCALE
+                        np.multiply(audio_data, scale, out=samples)
+                    elif audio_data.dtype == np.int16:
+                        samples = np.multiply(audio_data, _I16_SCALE, dtype=np.float32)
                     elif audio_data.dtype == np.int32:
-                        samples = audio_data.astype(np.float32) / 2147483648.0
+                        samples = np.multiply(audio_data, _I32_SCALE, dtype=np.float32)
                     else:
                         samples = audio_data.astype(np.float32)
                     
@@ -493,9 +862,9 @@ def handle_stream_binary(request_id: str, params: Dict, conn) -> None:
                     chunk_id += 1
                     
                 finally:
-                    # Clean up temp file immediately
-                    if os.path.exists(chunk_path):
-                        os.remove(chunk_path)
+                    # The samples are already in memory; let the pool
+                    # unlink the file while the next chunk generates
+                    _remove_later(chunk_path)
         
         # Send end marker
         write_end(conn, chunk_id)
@@ -513,6 +882,9 @@ def handle_stream_binary(request_id: str, params: Dict, conn) -> None:
             write_error(conn, str(e))
         except:
             pass  # Connection may already be broken
+    finally:
+        if req_dir:
+            _io_pool.submit(shutil.rmtree, req_dir, True)
 
 
 def handle_generate_stream(request_id: str, params: Dict, conn) -> Dict:
@@ -522,18 +894,23 @@ def handle_generate_stream(request_id: str, params: Dict, conn) -> Dict:
     Uses text chunking to prevent model destabilization on long inputs.
     Each text chunk is generated separately and sent to the client immediately,
     providing streaming behavior while maintaining audio quality.
+
+    With params {"pcm": true} the chunk messages carry the audio inline:
+    a JSON header line {"id", "chunk", "pcm_bytes", "sample_rate",
+    "dtype": "int16"} followed by that many raw little-endian int16 PCM
+    bytes. The client skips the per-chunk file open and the temp WAVs
+    are cleaned up server-side. Default remains audio_path messages.
     """
     text = params.get("text", "")
     model_name = params.get("model", "mlx-community/chatterbox-turbo-8bit")
     temperature = params.get("temperature", 0.5)
     speed = params.get("speed", 1.0)
     voice = params.get("voice")
+    pcm_inline = params.get("pcm", False)
 
     try:
-        from mlx_audio.tts.generate import generate_audio
-        import scipy.io.wavfile as wavfile
-        import io
-        from contextlib import redirect_stdout, redirect_stderr
+        if generate_audio is None:
+            return {"id": request_id, "error": {"code": 2, "message": "mlx_audio is not installed"}}
 
         # Split text into chunks to prevent model destabilization
         chunks = split_text_into_chunks(text)
@@ -547,18 +924,24 @@ def handle_generate_stream(request_id: str, params: Dict, conn) -> Dict:
         chunk_num = 0
         sample_rate = None
 
+        # Stat the voice reference once instead of per chunk
+        ref_audio = voice if voice and os.path.exists(voice) else None
+
         # Generate each text chunk and send immediately
         for i, text_chunk in enumerate(chunks):
+            if _stop_event.is_set():
+                break
+
             chunk_prefix = os.path.join(TEMP_DIR, f"speak_stream_{timestamp}_chunk{i}")
 
             log("debug", f"Generating text chunk {i+1}/{len(chunks)}: {len(text_chunk)} chars")
 
             # Generate this chunk (non-streaming to avoid destabilization)
-            with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+            with _silence():
                 generate_audio(
                     text=text_chunk,
                     model=model_name,
-                    ref_audio=voice if voice and os.path.exists(voice) else None,
+                    ref_audio=ref_audio,
                     temperature=temperature,
                     speed=speed,
                     file_prefix=chunk_prefix,
@@ -570,16 +953,45 @@ def handle_generate_stream(request_id: str, params: Dict, conn) -> Dict:
                 )
 
             # Find generated file(s) for this chunk
-            chunk_files = sorted([
-                f for f in os.listdir(TEMP_DIR)
-                if f.startswith(f"speak_stream_{timestamp}_chunk{i}") and f.endswith(".wav")
-            ])
+            chunk_files = sorted(glob.iglob(chunk_prefix + "*.wav"))
 
             # Send each generated audio file as a stream chunk
-            for cf in chunk_files:
-                chunk_path = os.path.join(TEMP_DIR, cf)
+            for chunk_path in chunk_files:
                 try:
-                    sr, audio_data = wavfile.read(chunk_path)
+                    if pcm_inline:
+                        # Inline PCM: JSON header line, then the raw
+                        # samples - no WAV for the client to open
+                        sr, audio_data = _read_wav(chunk_path)
+                        if audio_data.dtype != np.int16:
+                            audio_data = np.multiply(
+                                np.clip(audio_data, -1.0, 1.0), 32767.0,
+                                dtype=np.float32).astype(np.int16)
+                        audio_data = np.ascontiguousarray(audio_data)
+                        if sample_rate is None:
+                            sample_rate = sr
+
+                        chunk_duration = len(audio_data) / sr
+                        total_duration += chunk_duration
+                        chunk_num += 1
+
+                        header = {
+                            "id": request_id,
+                            "chunk": chunk_num,
+                            "pcm_bytes": audio_data.nbytes,
+                            "sample_rate": sr,
+                            "dtype": "int16",
+                            "duration": chunk_duration,
+                        }
+                        # Header line and samples gathered into one
+                        # sendmsg instead of two writes per chunk
+                        _send_vectored(conn, _dumps(header) + b"\n", audio_data)
+                        _remove_later(chunk_path)
+                        log("debug", f"Sent PCM chunk {chunk_num}: {chunk_duration:.2f}s")
+                        continue
+
+                    # Only the rate and frame count are needed here;
+                    # mmap avoids loading the PCM payload
+                    sr, audio_data = wavfile.read(chunk_path, mmap=True)
                     if sample_rate is None:
                         sample_rate = sr
 
@@ -595,7 +1007,7 @@ def handle_generate_stream(request_id: str, params: Dict, conn) -> Dict:
                         "duration": chunk_duration,
                         "sample_rate": sr,
                     }
-                    conn.send((json.dumps(chunk_response) + "\n").encode("utf-8"))
+                    _send(conn, chunk_response)
                     log("debug", f"Sent chunk {chunk_num}: {chunk_duration:.2f}s")
 
                 except Exception as e:
@@ -624,9 +1036,21 @@ def handle_generate_stream(request_id: str, params: Dict, conn) -> Dict:
         }
 
 
+# Method table: one hash lookup per request instead of a chain of
+# string compares. Each entry is (handler, is_tts_request); handlers
+# share the (request_id, params, conn) signature. stream-binary
+# switches to the binary protocol and returns None - no JSON response.
+_DISPATCH = {
+    "generate": (handle_generate, True),
+    "stream-binary": (handle_stream_binary, True),
+    "health": (handle_health, False),
+    "list-models": (handle_list_models, False),
+}
+
+
 def handle_request(request: Dict, conn=None) -> tuple:
     """Route request to appropriate handler.
-    
+
     Returns:
         (response, is_tts_request) - response may be None for binary streaming
     """
@@ -634,21 +1058,97 @@ def handle_request(request: Dict, conn=None) -> tuple:
     method = request.get("method", "")
     params = request.get("params", {})
 
-    if method == "generate":
-        return handle_generate(request_id, params, conn), True
-    elif method == "stream-binary":
-        # Binary streaming - no JSON response, switches to binary protocol
-        handle_stream_binary(request_id, params, conn)
-        return None, True  # Signal no JSON response needed
-    elif method == "health":
-        return handle_health(request_id, params), False
-    elif method == "list-models":
-        return handle_list_models(request_id, params), False
-    else:
+    entry = _DISPATCH.get(method)
+    if entry is None:
         return {
             "id": request_id,
             "error": {"code": -1, "message": f"Unknown method: {method}"}
         }, False
+    handler, is_tts = entry
+    return handler(request_id, params, conn), is_tts
+
+
+class _ClientState:
+    """Per-connection receive buffer for the multiplexed accept loop."""
+
+    __slots__ = ('buf', 'used')
+
+    def __init__(self):
+        self.buf = bytearray(65536)
+        self.used = 0
+
+
+def service_connection(conn, state: _ClientState) -> tuple:
+    """
+    One readiness-driven service pass for a client connection.
+
+    Does a single recv_into into the connection's persistent buffer
+    (doubling up to MAX_LINE_BYTES if a line outgrows it), then
+    dispatches every complete line. Request handlers still run to
+    completion here - generation serializes on the single model - but
+    between passes other clients' requests get their turn.
+
+    Returns:
+        (did_tts, closed, shutdown)
+    """
+    did_tts = False
+    buf = state.buf
+    used = state.used
+    if used == len(buf):
+        if len(buf) >= MAX_LINE_BYTES:
+            log("warn", f"Request line exceeds {MAX_LINE_BYTES} bytes - dropping connection")
+            _send(conn, {"error": {"code": -32700, "message": "Request line too long"}})
+            return did_tts, True, False
+        buf.extend(bytes(len(buf)))
+    n = conn.recv_into(memoryview(buf)[used:])
+    if not n:
+        return did_tts, True, False
+    used += n
+
+    # Process complete lines
+    while True:
+        nl = buf.find(b"\n", 0, used)
+        if nl < 0:
+            break
+        line = bytes(buf[:nl]).strip()
+        # Shift the unconsumed tail to the front; the buffer itself
+        # is reused across lines
+        rest = used - (nl + 1)
+        buf[:rest] = buf[nl + 1:used]
+        used = rest
+        if not line:
+            continue
+
+        try:
+            request = _loads(line)
+
+            # Handle shutdown
+            if request.get("method") == "shutdown":
+                log("info", "Shutdown requested")
+                response = {"id": request.get("id"), "result": {"status": "shutting_down"}}
+                _send(conn, response)
+                state.used = used
+                return did_tts, True, True
+
+            # Handle other requests
+            response, is_tts = handle_request(request, conn)
+
+            if is_tts:
+                did_tts = True
+
+            # Only send JSON response if handler returned one
+            # (binary streaming handlers return None)
+            if response is not None:
+                _send(conn, response)
+
+        except ValueError as e:
+            # Covers both json.JSONDecodeError and
+            # orjson.JSONDecodeError
+            error_response = {"error": {"code": -32700, "message": f"Parse error: {e}"}}
+            _send(conn, error_response)
+
+    state.used = used
+    return did_tts, False, False
 
 
 def run_server():
@@ -660,88 +1160,149 @@ def run_server():
     # Create socket
     server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
     server.bind(SOCKET_PATH)
-    server.listen(1)
+    server.listen(8)
+
+    # Install the SIGTERM handler before announcing readiness, so a
+    # stop that races startup still drains through the cleanup path
+    # below instead of killing the process outright. The handler only
+    # sets _stop_event; the selector wakeup fd is hooked up with the
+    # event loop. Signal APIs are main-thread only, so skip the hookup
+    # when embedded in another thread.
+    on_main_thread = threading.current_thread() is threading.main_thread()
+    if on_main_thread:
+        signal.signal(signal.SIGTERM, lambda *_: _stop_event.set())
 
     log("info", f"Server listening on {SOCKET_PATH}")
+
     try:
-        print(json.dumps({"status": "ready", "socket": SOCKET_PATH}), flush=True)
+        # daemon.ts detects readiness by substring-matching this exact
+        # line ('"status": "ready"', space after the colon), so it must
+        # stay on stdlib json.dumps with default separators - the
+        # compact _dumps output would never match and the daemon would
+        # time out and kill us
+        ready_line = json.dumps({"status": "ready", "socket": SOCKET_PATH})
+        sys.stdout.buffer.write(ready_line.encode("utf-8") + b"\n")
+        sys.stdout.buffer.flush()
     except BrokenPipeError:
         # Parent may have exited before reading ready signal - continue anyway
         pass
 
+    # Pre-warm the default model so the first request (and the first
+    # request after each idle restart) skips the multi-second load.
+    # This happens after the ready signal, on a background thread: the
+    # daemon kills the server if ready has not arrived in 30s, and a
+    # cold-cache model download alone can blow that budget. A request
+    # that beats the warm-up just waits on the load lock like any lazy
+    # load. Set SPEAK_PRELOAD_MODEL=none to skip warming entirely.
+    preload = os.environ.get("SPEAK_PRELOAD_MODEL", "mlx-community/chatterbox-turbo-8bit")
+    if preload and preload.lower() not in ("0", "none", "false"):
+        def _warm():
+            try:
+                load_model(preload)
+            except Exception as e:
+                log("warn", f"Model pre-load failed: {e}")
+        threading.Thread(target=_warm, name="speak-warmup", daemon=True).start()
+
     # Track last TTS inference time for idle shutdown
     last_tts_time = time.time()
 
+    # epoll/kqueue-backed readiness loop. The listener and every live
+    # connection are registered, so a health check is answered between
+    # another client's requests instead of waiting behind its whole
+    # connection. Sockets stay blocking: the selector only tells us a
+    # recv will not block, and handlers keep their synchronous sendall
+    # semantics.
+    sel = selectors.DefaultSelector()
+    sel.register(server, selectors.EVENT_READ)
+    clients: Dict[socket.socket, _ClientState] = {}
+
+    # SIGTERM wakeup fd: the interpreter writes to it on signal
+    # delivery, and registering the read end with the selector makes a
+    # blocked select() return immediately so the loop-top _stop_event
+    # check fires.
+    wake_r = wake_w = None
+    if on_main_thread:
+        wake_r, wake_w = socket.socketpair()
+        wake_r.setblocking(False)
+        wake_w.setblocking(False)
+        signal.set_wakeup_fd(wake_w.fileno())
+        sel.register(wake_r, selectors.EVENT_READ)
+
+    def _drop(conn):
+        sel.unregister(conn)
+        del clients[conn]
+        conn.close()
+        log("debug", "Client disconnected")
+
     try:
         while True:
+            if _stop_event.is_set():
+                log("info", "SIGTERM received - shutting down")
+                break
+
             # Check for idle timeout (1 hour since last TTS)
             idle_seconds = time.time() - last_tts_time
             if idle_seconds > IDLE_TIMEOUT_SECONDS:
                 log("info", f"Idle timeout ({IDLE_TIMEOUT_SECONDS}s) - shutting down")
                 break
 
-            # Use select to wait for connection with timeout (check idle every 60s)
-            ready, _, _ = select.select([server], [], [], 60)
-            if not ready:
-                # Timeout - loop back to check idle timeout
+            # Block until a socket is ready or the idle deadline
+            # passes; no fixed polling wakeups
+            events = sel.select(timeout=IDLE_TIMEOUT_SECONDS - idle_seconds)
+            if not events:
+                # Deadline reached - loop back to the idle check
                 continue
 
-            conn, addr = server.accept()
-            log("debug", "Client connected")
+            for key, _ in events:
+                if key.fileobj is wake_r:
+                    # Drain the signal wakeup byte; the loop-top check
+                    # acts on _stop_event
+                    try:
+                        wake_r.recv(4096)
+                    except BlockingIOError:
+                        pass
+                    continue
+
+                if key.fileobj is server:
+                    conn, addr = server.accept()
+                    if SOCK_BUF_BYTES:
+                        try:
+                            conn.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCK_BUF_BYTES)
+                            conn.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCK_BUF_BYTES)
+                        except OSError:
+                            pass  # Kernel may cap or reject the size; defaults are fine
+                    sel.register(conn, selectors.EVENT_READ)
+                    clients[conn] = _ClientState()
+                    log("debug", "Client connected")
+                    continue
+
+                conn = key.fileobj
+                try:
+                    did_tts, closed, shutdown = service_connection(conn, clients[conn])
+                except Exception as e:
+                    log("error", f"Connection error: {e}")
+                    did_tts, closed, shutdown = False, True, False
 
-            try:
-                # Read request line by line
-                buffer = b""
-                while True:
-                    data = conn.recv(4096)
-                    if not data:
-                        break
-
-                    buffer += data
-
-                    # Process complete lines
-                    while b"\n" in buffer:
-                        line, buffer = buffer.split(b"\n", 1)
-                        line = line.strip()
-                        if not line:
-                            continue
+                # Update idle timer on TTS requests
+                if did_tts:
+                    last_tts_time = time.time()
 
-                        try:
-                            request = json.loads(line.decode("utf-8"))
-
-                            # Handle shutdown
-                            if request.get("method") == "shutdown":
-                                log("info", "Shutdown requested")
-                                response = {"id": request.get("id"), "result": {"status": "shutting_down"}}
-                                conn.send((json.dumps(response) + "\n").encode("utf-8"))
-                                conn.close()
-                                return
-
-                            # Handle other requests
-                            response, is_tts = handle_request(request, conn)
-                            
-                            # Update idle timer on TTS requests
-                            if is_tts:
-                                last_tts_time = time.time()
-                            
-                            # Only send JSON response if handler returned one
-                            # (binary streaming handlers return None)
-                            if response is not None:
-                                conn.send((json.dumps(response) + "\n").encode("utf-8"))
-
-                        except json.JSONDecodeError as e:
-                            error_response = {"error": {"code": -32700, "message": f"Parse error: {e}"}}
-                            conn.send((json.dumps(error_response) + "\n").encode("utf-8"))
+                if shutdown:
+                    return
 
-            except Exception as e:
-                log("error", f"Connection error: {e}")
-            finally:
-                conn.close()
-                log("debug", "Client disconnected")
+                if closed:
+                    _drop(conn)
 
     except KeyboardInterrupt:
         log("info", "Server interrupted")
     finally:
+        if wake_r is not None:
+            signal.set_wakeup_fd(-1)
+            wake_r.close()
+            wake_w.close()
+        for conn in list(clients):
+            conn.close()
+        sel.close()
         server.close()
         if os.path.exists(SOCKET_PATH):
             os.remove(SOCKET_PATH)